@@ -20,8 +20,6 @@ bl_info = {
     "category": "Material",
 }
 
-import bpy
-
 def register():
     """Register the addon."""
     # Import here to avoid issues during module loading
@@ -11,25 +11,59 @@ Compatible with Blender 4.2+
 import bpy
 import json
 import mathutils
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, is_dataclass
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
-# Try to import clipboard functionality
+# Use orjson for (de)serialization when available, falling back to stdlib json
 try:
-    import pyperclip
-    HAS_CLIPBOARD = True
-    print("Material Serializer: pyperclip imported successfully")
-except ImportError as e:
-    HAS_CLIPBOARD = False
-    print(f"Material Serializer: pyperclip not available - {e}")
-    print("Material Serializer: Clipboard functions will be disabled")
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
-def serialize_material(material: bpy.types.Material) -> str:
+@dataclass(slots=True)
+class _SerializedSocket:
+    """Serialized node socket without a stored default value."""
+    name: str
+    type: str
+    identifier: str
+
+
+@dataclass(slots=True)
+class _SerializedValueSocket(_SerializedSocket):
+    """Serialized node socket with its default value."""
+    default_value: Any
+
+
+@dataclass(slots=True)
+class _SerializedNode:
+    """Serialized node with its sockets and node-specific properties."""
+    name: str
+    type: str
+    location: Tuple[float, ...]
+    inputs: List[_SerializedSocket]
+    outputs: List[_SerializedSocket]
+    properties: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class _SerializedLink:
+    """Serialized link between two node sockets."""
+    from_node: str
+    from_socket: str
+    to_node: str
+    to_socket: str
+
+
+def serialize_material(material: bpy.types.Material, pretty: bool = False) -> str:
     """
     Serialize a Blender material and its node tree into a JSON string.
 
     Args:
         material: The Blender material to serialize
+        pretty: Whether to indent the JSON for readability (compact by default)
 
     Returns:
         JSON string representation of the material
@@ -49,7 +83,7 @@ def serialize_material(material: bpy.types.Material) -> str:
         "node_tree": _serialize_node_tree(material.node_tree)
     }
 
-    return json.dumps(material_data, indent=2)
+    return _json_dumps(material_data, pretty)
 
 
 def deserialize_material(json_str: str, material_name: Optional[str] = None) -> bpy.types.Material:
@@ -64,12 +98,12 @@ def deserialize_material(json_str: str, material_name: Optional[str] = None) ->
         The newly created Blender material
 
     Raises:
-        ValueError: If JSON is invalid or material creation fails
-        json.JSONDecodeError: If JSON parsing fails
+        ValueError: If JSON is invalid (parse errors from any JSON backend are raised
+            as ValueError) or material creation fails
     """
     try:
-        material_data = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        material_data = _json_loads(json_str)
+    except ValueError as e:
         raise ValueError(f"Invalid JSON format: {e}")
 
     if "node_tree" not in material_data:
@@ -89,6 +123,73 @@ def deserialize_material(json_str: str, material_name: Optional[str] = None) ->
     return material
 
 
+# RNA property types that can be stored as plain JSON values
+_SERIALIZABLE_PROPERTY_TYPES = frozenset({'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'})
+
+# Node types whose value lives on an output socket rather than an input
+_VALUE_OUTPUT_NODE_TYPES = frozenset({"ShaderNodeRGB", "ShaderNodeValue"})
+
+# Per-type caches so RNA is only probed once per node/socket type
+_NODE_TYPE_SCHEMA: Dict[str, Dict[str, bool]] = {}
+_SOCKET_HAS_DEFAULT: Dict[str, bool] = {}
+
+
+def _json_dumps(data: Dict[str, Any], pretty: bool = False) -> str:
+    """
+    Encode data as a JSON string.
+
+    Args:
+        data: The data to encode
+        pretty: Whether to indent the output instead of using compact separators
+
+    Returns:
+        JSON string representation of the data
+    """
+    if HAS_ORJSON:
+        # orjson serializes the slotted dataclasses natively
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+    if pretty:
+        return json.dumps(data, indent=2, default=_dataclass_to_dict)
+    return json.dumps(data, separators=(',', ':'), default=_dataclass_to_dict)
+
+
+def _dataclass_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Convert a serialized dataclass record to a dictionary for the stdlib JSON encoder.
+
+    Args:
+        obj: The object the encoder could not serialize
+
+    Returns:
+        Dictionary of the record's fields
+
+    Raises:
+        TypeError: If the object is not a dataclass instance
+    """
+    if is_dataclass(obj):
+        # __dataclass_fields__ includes inherited fields, unlike __slots__
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_loads(json_str: str) -> Any:
+    """
+    Decode a JSON string.
+
+    Args:
+        json_str: The JSON string to decode
+
+    Returns:
+        The decoded data
+
+    Raises:
+        ValueError: If JSON parsing fails
+    """
+    if HAS_ORJSON:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
 def _serialize_node_tree(node_tree: bpy.types.NodeTree) -> Dict[str, Any]:
     """
     Serialize a node tree including nodes and links.
@@ -99,26 +200,13 @@ def _serialize_node_tree(node_tree: bpy.types.NodeTree) -> Dict[str, Any]:
     Returns:
         Dictionary containing node tree data
     """
-    nodes_data = []
-    links_data = []
-
-    # Serialize nodes
-    for node in node_tree.nodes:
-        node_data = _serialize_node(node)
-        nodes_data.append(node_data)
-
-    # Serialize links
-    for link in node_tree.links:
-        link_data = _serialize_link(link)
-        links_data.append(link_data)
-
     return {
-        "nodes": nodes_data,
-        "links": links_data
+        "nodes": [_serialize_node(node) for node in node_tree.nodes],
+        "links": [_serialize_link(link) for link in node_tree.links]
     }
 
 
-def _serialize_node(node: bpy.types.Node) -> Dict[str, Any]:
+def _serialize_node(node: bpy.types.Node) -> _SerializedNode:
     """
     Serialize a single node and its properties.
 
@@ -126,53 +214,41 @@ def _serialize_node(node: bpy.types.Node) -> Dict[str, Any]:
         node: The node to serialize
 
     Returns:
-        Dictionary containing node data
-    """
-    node_data = {
-        "name": node.name,
-        "type": node.bl_idname,  # Use bl_idname instead of type for proper node creation
-        "location": list(node.location),
-        "inputs": [],
-        "outputs": []
-    }
-
-    # Serialize inputs
-    for input_socket in node.inputs:
-        input_data = _serialize_socket(input_socket)
-        node_data["inputs"].append(input_data)
-
-    # Serialize outputs
-    for output_socket in node.outputs:
-        output_data = _serialize_socket(output_socket)
-        node_data["outputs"].append(output_data)
+        Serialized node record
+    """
+    node_type = node.bl_idname  # Use bl_idname instead of type for proper node creation
 
-    # Serialize node-specific properties
-    node_data["properties"] = _serialize_node_properties(node)
+    # Only value nodes store a meaningful output default
+    store_output_defaults = node_type in _VALUE_OUTPUT_NODE_TYPES
 
-    return node_data
+    return _SerializedNode(
+        node.name,
+        node_type,
+        node.location[:],
+        # Linked inputs take their value from the link, so skip their default
+        [_serialize_socket(input_socket, not input_socket.is_linked) for input_socket in node.inputs],
+        [_serialize_socket(output_socket, store_output_defaults) for output_socket in node.outputs],
+        _serialize_node_properties(node)
+    )
 
 
-def _serialize_socket(socket: bpy.types.NodeSocket) -> Dict[str, Any]:
+def _serialize_socket(socket: bpy.types.NodeSocket, include_default: bool = True) -> _SerializedSocket:
     """
     Serialize a node socket (input or output).
 
     Args:
         socket: The socket to serialize
+        include_default: Whether to store the socket's default value
 
     Returns:
-        Dictionary containing socket data
+        Serialized socket record
     """
-    socket_data = {
-        "name": socket.name,
-        "type": socket.type,
-        "identifier": socket.identifier
-    }
-
-    # Serialize default values for inputs
-    if hasattr(socket, 'default_value'):
-        socket_data["default_value"] = _serialize_default_value(socket.default_value)
+    # Serialize default values; sockets without one leave the key out entirely
+    if include_default and _socket_has_default(socket):
+        return _SerializedValueSocket(socket.name, socket.type, socket.identifier,
+                                      _serialize_default_value(socket.default_value))
 
-    return socket_data
+    return _SerializedSocket(socket.name, socket.type, socket.identifier)
 
 
 def _serialize_default_value(value: Any) -> Any:
@@ -185,18 +261,40 @@ def _serialize_default_value(value: Any) -> Any:
     Returns:
         Serialized value
     """
-    if isinstance(value, (int, float, str, bool)):
-        return value
-    elif isinstance(value, mathutils.Vector):
-        return list(value)
-    elif isinstance(value, mathutils.Color):
-        return list(value)
-    elif hasattr(value, '__iter__') and not isinstance(value, str):
-        # Handle arrays/lists
-        return list(value)
-    else:
-        # For unsupported types, return string representation
-        return str(value)
+    encode = _DEFAULT_VALUE_ENCODERS.get(type(value))
+    if encode is None:
+        if hasattr(value, '__getitem__') and hasattr(value, '__len__'):
+            # Handle arrays (e.g. RNA float arrays) with a single slice copy
+            encode = _copy_array
+        elif hasattr(value, '__iter__'):
+            # Handle other iterables
+            encode = tuple
+        else:
+            # For unsupported types, use string representation
+            encode = str
+        _DEFAULT_VALUE_ENCODERS[type(value)] = encode
+    return encode(value)
+
+
+def _identity(value: Any) -> Any:
+    """Return a value unchanged."""
+    return value
+
+
+# Copy a whole vector/array in one C-level slice instead of iterating element by element
+_copy_array = itemgetter(slice(None))
+
+
+# Default value encoders keyed by exact type; other types are classified on first use
+_DEFAULT_VALUE_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    str: _identity,
+    mathutils.Vector: _copy_array,
+    mathutils.Color: _copy_array,
+    mathutils.Euler: _copy_array,
+}
 
 
 def _serialize_node_properties(node: bpy.types.Node) -> Dict[str, Any]:
@@ -211,23 +309,60 @@ def _serialize_node_properties(node: bpy.types.Node) -> Dict[str, Any]:
     """
     properties = {}
 
-    # Common properties for different node types
-    if hasattr(node, 'blend_type') and node.blend_type:
-        properties['blend_type'] = node.blend_type
+    # Store every property: a new node starts from its init callback's values,
+    # which can differ from the RNA defaults, so nothing can be assumed unchanged
+    for name, is_array in _get_node_schema(node).items():
+        value = getattr(node, name)
+        properties[name] = value[:] if is_array else value
 
-    if hasattr(node, 'operation') and node.operation:
-        properties['operation'] = node.operation
+    return properties
 
-    if hasattr(node, 'inputs') and len(node.inputs) > 0:
-        # Serialize input values that aren't connected
-        for i, input_socket in enumerate(node.inputs):
-            if not input_socket.is_linked and hasattr(input_socket, 'default_value'):
-                properties[f'input_{i}_default'] = _serialize_default_value(input_socket.default_value)
 
-    return properties
+def _get_node_schema(node: bpy.types.Node) -> Dict[str, bool]:
+    """
+    Get the serializable properties for a node's type, computing them on first use.
+
+    Only writable, type-specific properties with plain values are included;
+    properties shared by all nodes (name, location, sockets, ...) are handled separately.
+
+    Args:
+        node: The node to look up the schema for
+
+    Returns:
+        Dictionary mapping property names to whether they are arrays
+    """
+    schema = _NODE_TYPE_SCHEMA.get(node.bl_idname)
+    if schema is None:
+        base_properties = bpy.types.Node.bl_rna.properties
+        schema = {}
+        for prop in node.bl_rna.properties:
+            if (prop.is_readonly or prop.type not in _SERIALIZABLE_PROPERTY_TYPES
+                    or prop.identifier in base_properties
+                    or getattr(prop, 'is_enum_flag', False)):
+                continue
+            schema[prop.identifier] = bool(getattr(prop, 'array_length', 0))
+        _NODE_TYPE_SCHEMA[node.bl_idname] = schema
+    return schema
+
+
+def _socket_has_default(socket: bpy.types.NodeSocket) -> bool:
+    """
+    Check whether a socket's type carries a default value, caching the result per type.
+
+    Args:
+        socket: The socket to check
+
+    Returns:
+        True if the socket type has a default_value property
+    """
+    has_default = _SOCKET_HAS_DEFAULT.get(socket.bl_idname)
+    if has_default is None:
+        has_default = 'default_value' in socket.bl_rna.properties
+        _SOCKET_HAS_DEFAULT[socket.bl_idname] = has_default
+    return has_default
 
 
-def _serialize_link(link: bpy.types.NodeLink) -> Dict[str, Any]:
+def _serialize_link(link: bpy.types.NodeLink) -> _SerializedLink:
     """
     Serialize a link between nodes.
 
@@ -235,14 +370,25 @@ def _serialize_link(link: bpy.types.NodeLink) -> Dict[str, Any]:
         link: The link to serialize
 
     Returns:
-        Dictionary containing link data
+        Serialized link record
     """
-    return {
-        "from_node": link.from_node.name,
-        "from_socket": link.from_socket.identifier,
-        "to_node": link.to_node.name,
-        "to_socket": link.to_socket.identifier
-    }
+    return _SerializedLink(
+        link.from_node.name,
+        link.from_socket.identifier,
+        link.to_node.name,
+        link.to_socket.identifier
+    )
+
+
+@dataclass(slots=True)
+class _NodeSpec:
+    """Node creation spec resolved from serialized data, ready to apply to a node tree."""
+    name: str
+    type: str
+    location: Optional[Tuple[float, float]]
+    properties: Dict[str, Any]
+    input_defaults: List[Tuple[int, Any]]
+    output_defaults: List[Tuple[int, Any]]
 
 
 def _deserialize_node_tree(node_tree: bpy.types.NodeTree, tree_data: Dict[str, Any]) -> None:
@@ -253,63 +399,186 @@ def _deserialize_node_tree(node_tree: bpy.types.NodeTree, tree_data: Dict[str, A
         node_tree: The Blender node tree to populate
         tree_data: Dictionary containing serialized node tree data
     """
-    nodes_dict = {}
+    # Resolve all serialized data up front so the apply loop only touches Blender
+    node_specs = [_prepare_node_spec(node_data) for node_data in tree_data.get("nodes", [])]
+
+    socket_index = {}
 
     # Create nodes
-    for node_data in tree_data.get("nodes", []):
-        node = _deserialize_node(node_tree, node_data)
-        nodes_dict[node.name] = node
+    for spec in node_specs:
+        node = _deserialize_node(node_tree, spec)
+
+        # Index sockets once so links resolve without scanning every socket
+        for output in node.outputs:
+            socket_index[(node.name, output.identifier, True)] = output
+        for input_socket in node.inputs:
+            socket_index[(node.name, input_socket.identifier, False)] = input_socket
 
     # Create links
+    new_link = node_tree.links.new
     for link_data in tree_data.get("links", []):
-        _deserialize_link(node_tree, link_data, nodes_dict)
+        link_sockets = _resolve_link(link_data, socket_index)
+        if link_sockets:
+            new_link(*link_sockets)
 
 
-def _deserialize_node(node_tree: bpy.types.NodeTree, node_data: Dict[str, Any]) -> bpy.types.Node:
+def _prepare_node_spec(node_data: Dict[str, Any]) -> _NodeSpec:
     """
-    Deserialize a single node.
+    Resolve serialized node data into a creation spec without touching Blender data.
 
     Args:
-        node_tree: The node tree to add the node to
         node_data: Dictionary containing serialized node data
 
     Returns:
-        The newly created node
+        The resolved node spec
+    """
+    location = node_data.get("location")
+
+    return _NodeSpec(
+        node_data.get("name", ""),
+        # Handle legacy node type names (convert old format to new format)
+        _convert_legacy_node_type(node_data.get("type", "ShaderNodeRGB")),
+        (location[0], location[1]) if location else None,
+        node_data.get("properties", {}),
+        _collect_socket_defaults(node_data.get("inputs", [])),
+        _collect_socket_defaults(node_data.get("outputs", []))
+    )
+
+
+def _collect_socket_defaults(sockets_data: List[Dict[str, Any]]) -> List[Tuple[int, Any]]:
+    """
+    Collect the stored default values of serialized sockets.
+
+    Args:
+        sockets_data: List of serialized socket dictionaries
+
+    Returns:
+        List of (socket index, default value) pairs for sockets with a stored default
+    """
+    return [(i, socket_data["default_value"]) for i, socket_data in enumerate(sockets_data)
+            if socket_data.get("default_value") is not None]
+
+
+def _deserialize_node(node_tree: bpy.types.NodeTree, spec: _NodeSpec) -> bpy.types.Node:
     """
-    node_type = node_data.get("type", "ShaderNodeRGB")
-    node_name = node_data.get("name", "")
+    Deserialize a single node.
 
-    # Handle legacy node type names (convert old format to new format)
-    node_type = _convert_legacy_node_type(node_type)
+    Args:
+        node_tree: The node tree to add the node to
+        spec: The resolved node spec
 
+    Returns:
+        The newly created node
+    """
     # Create the node
     try:
-        node = node_tree.nodes.new(type=node_type)
+        node = node_tree.nodes.new(type=spec.type)
     except Exception as e:
-        print(f"Error creating node of type '{node_type}': {e}")
+        print(f"Error creating node of type '{spec.type}': {e}")
         print("Falling back to ShaderNodeRGB")
         node = node_tree.nodes.new(type="ShaderNodeRGB")
 
-    if node_name:
-        node.name = node_name
+    if spec.name:
+        node.name = spec.name
 
     # Set location
-    if "location" in node_data:
-        node.location = node_data["location"]
+    if spec.location:
+        node.location = spec.location
 
     # Set properties
-    if "properties" in node_data:
-        _deserialize_node_properties(node, node_data["properties"])
+    if spec.properties:
+        _deserialize_node_properties(node, spec.properties)
 
     # Set input defaults
-    if "inputs" in node_data:
-        for i, input_data in enumerate(node_data["inputs"]):
-            if i < len(node.inputs) and "default_value" in input_data:
-                _deserialize_default_value(node.inputs[i], input_data["default_value"])
+    if spec.input_defaults:
+        inputs = node.inputs
+        for i, default_value in spec.input_defaults:
+            if i < len(inputs):
+                _deserialize_default_value(inputs[i], default_value)
+
+    # Set output defaults (e.g. the color of an RGB node)
+    if spec.output_defaults:
+        outputs = node.outputs
+        for i, default_value in spec.output_defaults:
+            if i < len(outputs):
+                _deserialize_default_value(outputs[i], default_value)
 
     return node
 
 
+# Map of legacy node types to proper Blender API names
+_LEGACY_NODE_TYPE_MAP = {
+    "OUTPUT_MATERIAL": "ShaderNodeOutputMaterial",
+    "BSDF_PRINCIPLED": "ShaderNodeBsdfPrincipled",
+    "TEX_IMAGE": "ShaderNodeTexImage",
+    "MIX_SHADER": "ShaderNodeMixShader",
+    "ADD_SHADER": "ShaderNodeAddShader",
+    "RGB": "ShaderNodeRGB",
+    "VALUE": "ShaderNodeValue",
+    "MATH": "ShaderNodeMath",
+    "MIX_RGB": "ShaderNodeMixRGB",
+    "INVERT": "ShaderNodeInvert",
+    "SEPARATE_RGB": "ShaderNodeSeparateRGB",
+    "COMBINE_RGB": "ShaderNodeCombineRGB",
+    "HUE_SATURATION": "ShaderNodeHueSaturation",
+    "BRIGHT_CONTRAST": "ShaderNodeBrightContrast",
+    "GAMMA": "ShaderNodeGamma",
+    "TEX_COORD": "ShaderNodeTexCoord",
+    "MAPPING": "ShaderNodeMapping",
+    "TEX_NOISE": "ShaderNodeTexNoise",
+    "TEX_CHECKER": "ShaderNodeTexChecker",
+    "TEX_GRADIENT": "ShaderNodeTexGradient",
+    "TEX_MAGIC": "ShaderNodeTexMagic",
+    "TEX_MUSGRAVE": "ShaderNodeTexMusgrave",
+    "TEX_VORONOI": "ShaderNodeTexVoronoi",
+    "TEX_WAVE": "ShaderNodeTexWave",
+    "NORMAL_MAP": "ShaderNodeNormalMap",
+    "BUMP": "ShaderNodeBump",
+    "DISPLACEMENT": "ShaderNodeDisplacement",
+    "VECTOR_DISPLACEMENT": "ShaderNodeVectorDisplacement",
+    "NORMAL": "ShaderNodeNormal",
+    "CURVE_RGB": "ShaderNodeRGBCurve",
+    "CURVE_VEC": "ShaderNodeVectorCurve",
+    "VALTORGB": "ShaderNodeValToRGB",
+    "RGBTOBW": "ShaderNodeRGBToBW",
+    "LIGHT_PATH": "ShaderNodeLightPath",
+    "FRESNEL": "ShaderNodeFresnel",
+    "LAYER_WEIGHT": "ShaderNodeLayerWeight",
+    "CAMERA_DATA": "ShaderNodeCameraData",
+    "TANGENT": "ShaderNodeTangent",
+    "GEOMETRY": "ShaderNodeGeometry",
+    "HAIR_INFO": "ShaderNodeHairInfo",
+    "OBJECT_INFO": "ShaderNodeObjectInfo",
+    "PARTICLE_INFO": "ShaderNodeParticleInfo",
+    "TEX_ENVIRONMENT": "ShaderNodeTexEnvironment",
+    "TEX_SKY": "ShaderNodeTexSky",
+    "VOLUME_SCATTER": "ShaderNodeVolumeScatter",
+    "VOLUME_ABSORPTION": "ShaderNodeVolumeAbsorption",
+    "VOLUME_PRINCIPLED": "ShaderNodeVolumePrincipled",
+    "SUBSURFACE_SCATTERING": "ShaderNodeSubsurfaceScattering",
+    "GLASS_BSDF": "ShaderNodeBsdfGlass",
+    "TRANSPARENT_BSDF": "ShaderNodeBsdfTransparent",
+    "REFRACTION_BSDF": "ShaderNodeBsdfRefraction",
+    "GLOSSY_BSDF": "ShaderNodeBsdfGlossy",
+    "DIFFUSE_BSDF": "ShaderNodeBsdfDiffuse",
+    "EMISSION": "ShaderNodeEmission",
+    "BACKGROUND": "ShaderNodeBackground",
+    "HOLDOUT": "ShaderNodeHoldout",
+    "VOLUME_INFO": "ShaderNodeVolumeInfo",
+    "ATTRIBUTE": "ShaderNodeAttribute",
+    "BEVEL": "ShaderNodeBevel",
+    "AMBIENT_OCCLUSION": "ShaderNodeAmbientOcclusion",
+    "WIREFRAME": "ShaderNodeWireframe",
+    "WAVELENGTH": "ShaderNodeWavelength",
+    "BLACKBODY": "ShaderNodeBlackbody",
+    "UV_MAP": "ShaderNodeUVMap",
+    "VERTEX_COLOR": "ShaderNodeVertexColor",
+    "GROUP": "ShaderNodeGroup",
+    "GROUP_INPUT": "NodeGroupInput",
+    "GROUP_OUTPUT": "NodeGroupOutput",
+}
+
+
 def _convert_legacy_node_type(node_type: str) -> str:
     """
     Convert legacy node type names to proper Blender API names.
@@ -320,84 +589,12 @@ def _convert_legacy_node_type(node_type: str) -> str:
     Returns:
         The proper Blender API node type name
     """
-    # Map of legacy node types to proper Blender API names
-    legacy_mapping = {
-        "OUTPUT_MATERIAL": "ShaderNodeOutputMaterial",
-        "BSDF_PRINCIPLED": "ShaderNodeBsdfPrincipled",
-        "TEX_IMAGE": "ShaderNodeTexImage",
-        "MIX_SHADER": "ShaderNodeMixShader",
-        "ADD_SHADER": "ShaderNodeAddShader",
-        "RGB": "ShaderNodeRGB",
-        "VALUE": "ShaderNodeValue",
-        "MATH": "ShaderNodeMath",
-        "MIX_RGB": "ShaderNodeMixRGB",
-        "INVERT": "ShaderNodeInvert",
-        "SEPARATE_RGB": "ShaderNodeSeparateRGB",
-        "COMBINE_RGB": "ShaderNodeCombineRGB",
-        "HUE_SATURATION": "ShaderNodeHueSaturation",
-        "BRIGHT_CONTRAST": "ShaderNodeBrightContrast",
-        "GAMMA": "ShaderNodeGamma",
-        "TEX_COORD": "ShaderNodeTexCoord",
-        "MAPPING": "ShaderNodeMapping",
-        "TEX_NOISE": "ShaderNodeTexNoise",
-        "TEX_CHECKER": "ShaderNodeTexChecker",
-        "TEX_GRADIENT": "ShaderNodeTexGradient",
-        "TEX_MAGIC": "ShaderNodeTexMagic",
-        "TEX_MUSGRAVE": "ShaderNodeTexMusgrave",
-        "TEX_VORONOI": "ShaderNodeTexVoronoi",
-        "TEX_WAVE": "ShaderNodeTexWave",
-        "NORMAL_MAP": "ShaderNodeNormalMap",
-        "BUMP": "ShaderNodeBump",
-        "DISPLACEMENT": "ShaderNodeDisplacement",
-        "VECTOR_DISPLACEMENT": "ShaderNodeVectorDisplacement",
-        "NORMAL": "ShaderNodeNormal",
-        "CURVE_RGB": "ShaderNodeRGBCurve",
-        "CURVE_VEC": "ShaderNodeVectorCurve",
-        "VALTORGB": "ShaderNodeValToRGB",
-        "RGBTOBW": "ShaderNodeRGBToBW",
-        "LIGHT_PATH": "ShaderNodeLightPath",
-        "FRESNEL": "ShaderNodeFresnel",
-        "LAYER_WEIGHT": "ShaderNodeLayerWeight",
-        "CAMERA_DATA": "ShaderNodeCameraData",
-        "TANGENT": "ShaderNodeTangent",
-        "GEOMETRY": "ShaderNodeGeometry",
-        "HAIR_INFO": "ShaderNodeHairInfo",
-        "OBJECT_INFO": "ShaderNodeObjectInfo",
-        "PARTICLE_INFO": "ShaderNodeParticleInfo",
-        "TEX_ENVIRONMENT": "ShaderNodeTexEnvironment",
-        "TEX_SKY": "ShaderNodeTexSky",
-        "VOLUME_SCATTER": "ShaderNodeVolumeScatter",
-        "VOLUME_ABSORPTION": "ShaderNodeVolumeAbsorption",
-        "VOLUME_PRINCIPLED": "ShaderNodeVolumePrincipled",
-        "SUBSURFACE_SCATTERING": "ShaderNodeSubsurfaceScattering",
-        "GLASS_BSDF": "ShaderNodeBsdfGlass",
-        "TRANSPARENT_BSDF": "ShaderNodeBsdfTransparent",
-        "REFRACTION_BSDF": "ShaderNodeBsdfRefraction",
-        "GLOSSY_BSDF": "ShaderNodeBsdfGlossy",
-        "DIFFUSE_BSDF": "ShaderNodeBsdfDiffuse",
-        "EMISSION": "ShaderNodeEmission",
-        "BACKGROUND": "ShaderNodeBackground",
-        "HOLDOUT": "ShaderNodeHoldout",
-        "VOLUME_INFO": "ShaderNodeVolumeInfo",
-        "ATTRIBUTE": "ShaderNodeAttribute",
-        "BEVEL": "ShaderNodeBevel",
-        "AMBIENT_OCCLUSION": "ShaderNodeAmbientOcclusion",
-        "WIREFRAME": "ShaderNodeWireframe",
-        "WAVELENGTH": "ShaderNodeWavelength",
-        "BLACKBODY": "ShaderNodeBlackbody",
-        "UV_MAP": "ShaderNodeUVMap",
-        "VERTEX_COLOR": "ShaderNodeVertexColor",
-        "GROUP": "ShaderNodeGroup",
-        "GROUP_INPUT": "NodeGroupInput",
-        "GROUP_OUTPUT": "NodeGroupOutput",
-    }
-
     # If it's already a proper Blender API name, return as-is
-    if node_type.startswith("ShaderNode") or node_type.startswith("Node"):
+    if node_type.startswith(("ShaderNode", "Node")):
         return node_type
 
     # Convert legacy name to proper name
-    return legacy_mapping.get(node_type, node_type)
+    return _LEGACY_NODE_TYPE_MAP.get(node_type, node_type)
 
 
 def _deserialize_node_properties(node: bpy.types.Node, properties: Dict[str, Any]) -> None:
@@ -408,13 +605,46 @@ def _deserialize_node_properties(node: bpy.types.Node, properties: Dict[str, Any
         node: The node to set properties on
         properties: Dictionary of properties to set
     """
+    schema = _get_node_schema(node)
+
     for key, value in properties.items():
-        if hasattr(node, key):
-            try:
-                setattr(node, key, value)
-            except (AttributeError, TypeError):
-                # Skip properties that can't be set
-                pass
+        # Skip properties this node type doesn't have (e.g. from other Blender versions)
+        if key not in schema:
+            continue
+        try:
+            setattr(node, key, value)
+        except (TypeError, ValueError) as e:
+            # Skip values this Blender version rejects (e.g. unknown enum items)
+            print(f"Warning: Could not set property '{key}' on node {node.name}: {e}")
+
+
+def _rgb_to_rgba(value: List[float]) -> Tuple[float, ...]:
+    """Add an opaque alpha component to an RGB value."""
+    return (*value, 1.0)
+
+
+def _drop_alpha(value: List[float]) -> Tuple[float, ...]:
+    """Keep only the first three components of a four-component value."""
+    return tuple(value[:3])
+
+
+# Socket types whose default value is a fixed-length array
+_ARRAY_SOCKET_TYPES = frozenset({'RGBA', 'VECTOR', 'ROTATION'})
+
+# Legacy conversions for array values whose length doesn't match the socket,
+# keyed by (socket type, serialized length, socket length)
+_ARRAY_VALUE_CONVERTERS: Dict[Tuple[str, int, int], Callable[[List[float]], Tuple[float, ...]]] = {
+    ('RGBA', 3, 4): _rgb_to_rgba,
+    ('VECTOR', 4, 3): _drop_alpha,
+}
+
+# Accepted Python types for scalar default values, keyed by socket type
+_SCALAR_VALUE_TYPES: Dict[str, Tuple[type, ...]] = {
+    'VALUE': (int, float),
+    'INT': (int,),
+    'BOOLEAN': (bool,),
+    'STRING': (str,),
+}
 
 
 def _deserialize_default_value(socket: bpy.types.NodeSocket, value: Any) -> None:
@@ -425,69 +655,50 @@ def _deserialize_default_value(socket: bpy.types.NodeSocket, value: Any) -> None
         socket: The socket to set the default value on
         value: The serialized default value
     """
-    try:
-        if isinstance(value, list):
-            if len(value) == 3:
-                # Handle RGB values
-                if socket.type == 'RGBA':
-                    # For RGBA sockets, add alpha component
-                    socket.default_value = list(value) + [1.0]
-                else:
-                    # For other sockets, use as vector or color
-                    socket.default_value = mathutils.Vector(value)
-            elif len(value) == 4:
-                # Handle RGBA values
-                if socket.type == 'RGBA':
-                    socket.default_value = value
-                else:
-                    # For non-RGBA sockets, use RGB part only
-                    socket.default_value = mathutils.Vector(value[:3]) if hasattr(socket, 'default_value') else value[:3]
-            else:
-                socket.default_value = value
-        else:
+    socket_type = socket.type
+
+    if isinstance(value, list):
+        if (socket_type in _ARRAY_SOCKET_TYPES
+                and all(isinstance(component, (int, float)) for component in value)):
+            # Validate against the target socket's size so assignment can't raise
+            socket_length = len(socket.default_value)
+            if len(value) == socket_length:
+                socket.default_value = tuple(value)
+                return
+            convert = _ARRAY_VALUE_CONVERTERS.get((socket_type, len(value), socket_length))
+            if convert:
+                socket.default_value = convert(value)
+                return
+    else:
+        accepted_types = _SCALAR_VALUE_TYPES.get(socket_type)
+        if accepted_types and isinstance(value, accepted_types):
             socket.default_value = value
-    except (AttributeError, TypeError) as e:
-        # Skip if can't set the value, but log for debugging
-        print(f"Warning: Could not set default value for socket {socket.name}: {e}")
-        pass
+            return
 
+    # Skip values that don't match the socket, but log for debugging
+    print(f"Warning: Could not set default value for socket {socket.name}: "
+          f"unsupported value {value!r} for {socket_type} socket")
 
-def _deserialize_link(node_tree: bpy.types.NodeTree, link_data: Dict[str, Any], nodes_dict: Dict[str, bpy.types.Node]) -> None:
+
+def _resolve_link(link_data: Dict[str, Any],
+                  socket_index: Dict[Tuple[str, str, bool], bpy.types.NodeSocket]
+                  ) -> Optional[Tuple[bpy.types.NodeSocket, bpy.types.NodeSocket]]:
     """
-    Deserialize a link between nodes.
+    Resolve the sockets a serialized link connects.
 
     Args:
-        node_tree: The node tree to add the link to
         link_data: Dictionary containing serialized link data
-        nodes_dict: Dictionary mapping node names to node objects
-    """
-    from_node_name = link_data.get("from_node")
-    to_node_name = link_data.get("to_node")
-    from_socket_id = link_data.get("from_socket")
-    to_socket_id = link_data.get("to_socket")
-
-    if from_node_name not in nodes_dict or to_node_name not in nodes_dict:
-        return  # Skip if nodes don't exist
-
-    from_node = nodes_dict[from_node_name]
-    to_node = nodes_dict[to_node_name]
-
-    # Find the sockets
-    from_socket = None
-    to_socket = None
-
-    for output in from_node.outputs:
-        if output.identifier == from_socket_id:
-            from_socket = output
-            break
+        socket_index: Dictionary mapping (node name, socket identifier, is_output) to sockets
 
-    for input_socket in to_node.inputs:
-        if input_socket.identifier == to_socket_id:
-            to_socket = input_socket
-            break
+    Returns:
+        The (from_socket, to_socket) pair, or None if either socket doesn't exist
+    """
+    from_socket = socket_index.get((link_data.get("from_node"), link_data.get("from_socket"), True))
+    to_socket = socket_index.get((link_data.get("to_node"), link_data.get("to_socket"), False))
 
     if from_socket and to_socket:
-        node_tree.links.new(from_socket, to_socket)
+        return from_socket, to_socket
+    return None
 
 
 # Clipboard functions
@@ -502,14 +713,10 @@ def copy_material_to_clipboard(material_name: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if not HAS_CLIPBOARD:
-        print("Error: pyperclip not installed. Install with: pip install pyperclip")
-        return False
-
     try:
         material = bpy.data.materials[material_name]
         json_str = serialize_material(material)
-        pyperclip.copy(json_str)
+        bpy.context.window_manager.clipboard = json_str
         print(f"✓ Material '{material_name}' copied to clipboard")
         return True
     except KeyError:
@@ -533,12 +740,8 @@ def paste_material_from_clipboard(material_name: Optional[str] = None) -> Option
     Returns:
         The newly created material, or None if failed
     """
-    if not HAS_CLIPBOARD:
-        print("Error: pyperclip not installed. Install with: pip install pyperclip")
-        return None
-
     try:
-        json_str = pyperclip.paste()
+        json_str = bpy.context.window_manager.clipboard
         material = deserialize_material(json_str, material_name)
         print(f"✓ Material pasted from clipboard: {material.name}")
         return material
@@ -558,7 +761,7 @@ def export_material_to_console(material_name: str) -> None:
     """
     try:
         material = bpy.data.materials[material_name]
-        json_str = serialize_material(material)
+        json_str = serialize_material(material, pretty=True)
         print("=" * 50)
         print(f"EXPORTED MATERIAL: {material_name}")
         print("=" * 50)
@@ -651,12 +854,6 @@ class MATERIAL_SERIALIZER_PT_panel(bpy.types.Panel):
         row = layout.row()
         row.operator("material_serializer.paste", icon='PASTEDOWN')
 
-        # Status info
-        if not HAS_CLIPBOARD:
-            box = layout.box()
-            box.label(text="Warning: pyperclip not installed", icon='ERROR')
-            box.label(text="Install with: pip install pyperclip")
-
 
 # Registration functions for Blender addon
 
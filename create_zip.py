@@ -8,18 +8,44 @@ import zipfile
 import os
 import datetime
 
+def _iter_files(path):
+    """Yield files under a directory, skipping hidden entries and bytecode caches"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or entry.name == '__pycache__':
+                continue
+            if entry.is_dir():
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+def build_zip(zip_filename, include_paths, root=".", compression=zipfile.ZIP_DEFLATED, compresslevel=6):
+    """Write the given files and directories (relative to root) into a zip, returning the file count"""
+    file_count = 0
+    with zipfile.ZipFile(zip_filename, 'w', compression, compresslevel=compresslevel) as zipf:
+        for path in include_paths:
+            full_path = os.path.join(root, path)
+            if os.path.isdir(full_path):
+                file_paths = _iter_files(full_path)
+            elif os.path.isfile(full_path):
+                file_paths = [full_path]
+            else:
+                continue
+
+            for file_path in file_paths:
+                zipf.write(file_path, os.path.relpath(file_path, root))
+                file_count += 1
+
+    return file_count
+
 def create_blender_zip():
     """Create the main Blender addon zip"""
-    import glob
-
     zip_filename = "BlenderMaterialCopyPaster.zip"
 
-    # Files to include in release
-    include_patterns = [
-        "MaterialCopyPaster/**/*",
+    # Files and directories to include in release
+    include_paths = [
+        "MaterialCopyPaster",
         "README.md",
-        "requirements.txt",
-        "install_dependencies.py",
         ".gitignore"
     ]
 
@@ -29,19 +55,11 @@ def create_blender_zip():
 
     print(f"📦 Creating {zip_filename}...")
 
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for pattern in include_patterns:
-            for file_path in glob.glob(pattern, recursive=True):
-                if os.path.isfile(file_path):
-                    arcname = os.path.relpath(file_path, ".")
-                    zipf.write(file_path, arcname)
-                    print(f"  ✅ Added: {arcname}")
-
+    file_count = build_zip(zip_filename, include_paths)
     zip_size = os.path.getsize(zip_filename)
-    file_count = len(list(zipfile.ZipFile(zip_filename, 'r').namelist()))
 
     print(f"\n🎉 Successfully created {zip_filename}")
-    print(",")
+    print(f"📏 Size: {zip_size} bytes")
     print(f"📁 Files included: {file_count}")
 
     return True
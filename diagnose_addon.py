@@ -3,69 +3,51 @@
 Diagnostic script for Material Serializer addon
 """
 
-def check_pyperclip():
-    """Check if pyperclip is installed"""
-    try:
-        import pyperclip
-        print("✓ pyperclip is installed")
-        return True
-    except ImportError as e:
-        print(f"✗ pyperclip not found: {e}")
-        return False
-
-def check_files():
-    """Check if all required files exist"""
+def scan_files():
+    """Check that all required files exist and have valid syntax in a single pass"""
     import os
+
     required_files = ['__init__.py', 'material_serializer.py']
-    missing = []
+    files_ok = True
+    syntax_ok = True
+
+    # One directory read instead of a stat call per required file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
 
     for file in required_files:
-        if os.path.exists(file):
-            print(f"✓ {file} exists")
-        else:
+        if file not in present:
             print(f"✗ {file} missing")
-            missing.append(file)
-
-    return len(missing) == 0
-
-def test_syntax():
-    """Test syntax of Python files"""
-    import subprocess
-    import sys
-
-    files = ['__init__.py', 'material_serializer.py']
-    all_good = True
+            files_ok = False
+            continue
 
-    for file in files:
         try:
-            result = subprocess.run([sys.executable, '-m', 'py_compile', file],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✓ {file} syntax OK")
-            else:
-                print(f"✗ {file} syntax error: {result.stderr}")
-                all_good = False
+            with open(file, encoding='utf-8') as f:
+                source = f.read()
         except Exception as e:
             print(f"✗ Error checking {file}: {e}")
-            all_good = False
+            syntax_ok = False
+            continue
 
-    return all_good
+        # Compile in-process; no subprocess and no .pyc written
+        try:
+            compile(source, file, 'exec')
+            print(f"✓ {file} exists, syntax OK")
+        except SyntaxError as e:
+            print(f"✗ {file} syntax error: {e}")
+            syntax_ok = False
+
+    return files_ok, syntax_ok
 
 if __name__ == "__main__":
     print("Material Serializer Addon Diagnostics")
     print("=" * 40)
 
-    print("\n1. Checking dependencies...")
-    pyperclip_ok = check_pyperclip()
-
-    print("\n2. Checking files...")
-    files_ok = check_files()
-
-    print("\n3. Checking syntax...")
-    syntax_ok = test_syntax()
+    print("\n1. Checking files and syntax...")
+    files_ok, syntax_ok = scan_files()
 
     print("\n" + "=" * 40)
-    if pyperclip_ok and files_ok and syntax_ok:
+    if files_ok and syntax_ok:
         print("✓ All checks passed! Addon should work.")
         print("\nNext steps:")
         print("1. Restart Blender")
@@ -75,11 +57,6 @@ if __name__ == "__main__":
     else:
         print("✗ Some issues found. Please fix them before installing.")
 
-        if not pyperclip_ok:
-            print("\nTo fix pyperclip:")
-            print("  pip install pyperclip")
-            print("  or run: python install_dependencies.py")
-
         if not files_ok:
             print("\nMissing files detected!")
 
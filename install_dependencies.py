@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """
-Installation script for Material Serializer dependencies
+Standalone installer for pyperclip
+
+The Material Copy Paster addon does not need pyperclip; it uses Blender's
+built-in clipboard. This script only installs pyperclip for other scripts.
 """
 
+import functools
 import subprocess
 import sys
 
@@ -10,13 +14,23 @@ def install_pyperclip():
     """Install pyperclip using pip"""
     try:
         print("Installing pyperclip...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyperclip"])
+        try:
+            # Run pip in this interpreter to skip a second Python startup
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyperclip"])
+        else:
+            exit_code = pip_main(["install", "pyperclip"])
+            if exit_code != 0:
+                raise subprocess.CalledProcessError(exit_code, "pip install pyperclip")
         print("✓ pyperclip installed successfully!")
+        check_pyperclip.cache_clear()
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ Failed to install pyperclip: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_pyperclip():
     """Check if pyperclip is already installed"""
     try:
@@ -27,16 +41,16 @@ def check_pyperclip():
         return False
 
 if __name__ == "__main__":
-    print("Material Serializer - Dependency Installer")
+    print("pyperclip Installer")
     print("=" * 40)
 
     if check_pyperclip():
-        print("All dependencies are installed!")
+        print("pyperclip is available!")
     else:
         print("pyperclip not found. Installing...")
         if install_pyperclip():
             print("\nInstallation complete!")
-            print("You can now use the Material Serializer addon.")
+            print("pyperclip is ready to use.")
         else:
             print("\nInstallation failed.")
             print("Please install pyperclip manually: pip install pyperclip")
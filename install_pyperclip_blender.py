@@ -2,6 +2,9 @@
 """
 Install pyperclip for Blender's Python environment
 Run this script inside Blender's Text Editor
+
+The Material Copy Paster addon does not need pyperclip; it uses Blender's
+built-in clipboard. This script only installs pyperclip for other scripts.
 """
 
 import subprocess
@@ -10,6 +13,24 @@ import os
 
 def install_pyperclip():
     """Install pyperclip in Blender's Python environment"""
+    from importlib.metadata import version, PackageNotFoundError
+
+    # Skip the pip subprocess entirely if the package is installed and importable
+    pip_args = ["install", "pyperclip"]
+    try:
+        installed_version = version('pyperclip')
+    except PackageNotFoundError:
+        pass
+    else:
+        try:
+            import pyperclip
+            print(f"✅ pyperclip {installed_version} is already installed")
+            return True
+        except ImportError as e:
+            # Metadata exists but the package is broken; a plain install would be a no-op
+            print(f"⚠️ pyperclip {installed_version} is installed but cannot be imported ({e}), reinstalling...")
+            pip_args.append("--force-reinstall")
+
     try:
         # Get Blender's Python executable path
         python_exe = sys.executable
@@ -17,12 +38,12 @@ def install_pyperclip():
 
         # Install pyperclip using Blender's pip
         result = subprocess.run([
-            python_exe, "-m", "pip", "install", "pyperclip"
+            python_exe, "-m", "pip", *pip_args
         ], capture_output=True, text=True)
 
         if result.returncode == 0:
             print("✅ pyperclip installed successfully!")
-            print("Restart Blender and the Material Serializer addon should work without warnings.")
+            print("Restart Blender to make pyperclip available to scripts.")
             return True
         else:
             print("❌ Installation failed:")
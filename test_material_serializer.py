@@ -14,6 +14,18 @@ sys.path.append(os.path.dirname(__file__))
 from material_serializer import serialize_material, deserialize_material, export_material_to_console, import_material_from_json
 
 
+TEST_MATERIAL_NAMES = ("Test_Material", "Deserialized_Test_Material", "Example_Imported_Material",
+                       "Test_Property_Material", "Deserialized_Property_Material")
+
+
+def clear_test_materials():
+    """Remove materials left over from previous test runs."""
+    for name in TEST_MATERIAL_NAMES:
+        material = bpy.data.materials.get(name)
+        if material:
+            bpy.data.materials.remove(material)
+
+
 def create_test_material():
     """Create a simple test material with nodes."""
     # Create new material
@@ -89,18 +101,53 @@ def test_deserialization(json_str):
         return None
 
 
+def test_node_property_round_trip():
+    """Test that node settings survive a round trip, including ones that differ from RNA defaults."""
+    print("\nTesting node property round trip...")
+    test_mat = bpy.data.materials.new(name="Test_Property_Material")
+    test_mat.use_nodes = True
+    nodes = test_mat.node_tree.nodes
+    nodes.clear()
+
+    # Map Range nodes are created clamped even though the RNA default for clamp is False
+    map_range = nodes.new(type="ShaderNodeMapRange")
+    map_range.clamp = False
+    map_range.interpolation_type = 'SMOOTHSTEP'
+
+    try:
+        json_str = serialize_material(test_mat)
+        new_mat = deserialize_material(json_str, "Deserialized_Property_Material")
+        new_map_range = next(n for n in new_mat.node_tree.nodes if n.bl_idname == "ShaderNodeMapRange")
+
+        if new_map_range.clamp is False and new_map_range.interpolation_type == 'SMOOTHSTEP':
+            print("✓ Node properties round-tripped!")
+            return True
+        print(f"✗ Node properties changed: clamp={new_map_range.clamp}, "
+              f"interpolation_type={new_map_range.interpolation_type}")
+        return False
+    except Exception as e:
+        print(f"✗ Node property round trip failed: {e}")
+        return False
+
+
 def run_tests():
     """Run all tests."""
     print("=" * 60)
     print("MATERIAL SERIALIZER/Deserializer TEST")
     print("=" * 60)
 
+    # Start from a clean slate so repeated runs don't create .001, .002, ... copies
+    clear_test_materials()
+
     # Test serialization
     json_str = test_serialization()
 
     # Test deserialization
     new_mat = test_deserialization(json_str)
 
+    # Test node-specific properties
+    test_node_property_round_trip()
+
     # Test example functions
     print("\n" + "=" * 60)
     print("TESTING EXAMPLE FUNCTIONS")